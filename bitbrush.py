@@ -8,7 +8,19 @@ a conceptual and practical code to systematically explore, test,
 and manipulate bits using expressive primitives.
 """
 
-from typing import Generator
+from typing import Generator, Union
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; only array inputs require it.
+    np = None
+
+Patterns = Union[Generator[int, None, None], "np.ndarray"]
+
+# Row b holds the bits of byte b, least significant first (used by pospopcount).
+_BYTE_BITS = (np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1,
+                            bitorder='little').astype(np.int64)
+              if np is not None else None)
 
 class BitBrush:
     """
@@ -17,57 +29,124 @@ class BitBrush:
     This class provides generators and utilities for controlled bit pattern generation,
     transformation, and visualization. The operations include sweeps, toggles,
     mirrors, and analytical functions such as bit counting.
+
+    With ``backend='numpy'`` the pattern methods return whole arrays of the
+    narrowest unsigned dtype fitting the width instead of generators, computed
+    in vectorized passes. These arrays are cached on the instance and returned
+    read-only; copy them to modify.
     """
 
-    def __init__(self, width: int = 32):
+    def __init__(self, width: int = 32, backend: str = 'python'):
         """
         Initializes the BitBrush instance with a given bit width.
 
         Args:
             width (int): Number of bits to operate on. Default is 32.
+            backend (str): 'python' for generators of ints, or 'numpy' for
+                unsigned integer arrays (requires NumPy, width <= 64). Default is 'python'.
         """
+        if backend not in ('python', 'numpy'):
+            raise ValueError(f"Unknown backend: {backend!r}")
+        if backend == 'numpy':
+            if np is None:
+                raise ImportError("The 'numpy' backend requires NumPy.")
+            if width > 64:
+                raise ValueError("The 'numpy' backend supports widths up to 64 bits.")
         self.width = width
+        self.backend = backend
         self.mask = (1 << width) - 1
         self._mirror_lut = self._build_mirror_lut()
+        self._mirror_bytes = (width + 7) // 8
+        self._mirror_shift = self._mirror_bytes * 8 - width
+        self._mirror_byte_mask = (1 << (self._mirror_bytes * 8)) - 1
+        self._seq_cache: dict[tuple, "np.ndarray"] = {}
+        self._dtype = None
+        if np is not None and width <= 64:
+            self._dtype = (np.uint8 if width <= 8 else np.uint16 if width <= 16
+                           else np.uint32 if width <= 32 else np.uint64)
+        self._bits = None
+        if backend == 'numpy':
+            # Shift in place over the positions buffer: one allocation, no fill.
+            self._bits = np.arange(width, dtype=self._dtype)
+            np.left_shift(self._dtype(1), self._bits, out=self._bits)
+            self._bits.setflags(write=False)
 
-    def _build_mirror_lut(self) -> list[int]:
+    def _build_mirror_lut(self) -> bytes:
         """
         Builds a lookup table (LUT) for fast 8-bit reversed values.
 
+        Each entry uses the closed-form byte reversal: the multiply fans the
+        byte out into five copies, the mask keeps one reversed bit from each,
+        and the modulus by 1023 folds them back into a single byte.
+        The table is returned as ``bytes`` so it can be used directly
+        as a ``bytes.translate`` table.
+
+        Returns:
+            bytes: 256 bytes, each containing the reversed bits of its index.
+        """
+        return bytes(((b * 0x0202020202) & 0x010884422010) % 1023 for b in range(256))
+
+    def _cached(self, key: tuple, build) -> "np.ndarray":
+        """
+        Returns the cached array for ``key``, building it on first use.
+
+        Cached arrays are marked read-only so they can be shared safely
+        between calls.
+
+        Args:
+            key (tuple): Cache key, the method name plus its arguments.
+            build (callable): Zero-argument function computing the array.
+
         Returns:
-            list[int]: A list of 256 integers, each containing the reversed bits of its index.
+            np.ndarray: The cached, read-only array.
         """
-        lut = [0] * 256
-        for i in range(256):
-            b = i
-            rev = 0
-            for _ in range(8):
-                rev = (rev << 1) | (b & 1)
-                b >>= 1
-            lut[i] = rev
-        return lut
+        arr = self._seq_cache.get(key)
+        if arr is None:
+            arr = build()
+            arr.setflags(write=False)
+            self._seq_cache[key] = arr
+        return arr
 
-    def sweep_ones(self) -> Generator[int, None, None]:
+    def sweep_ones(self) -> Patterns:
         """
         Generator that yields numbers with a sweeping '1' bit through the width.
 
         Yields:
             int: An integer with a single bit set, sweeping from LSB to MSB.
+
+        Returns:
+            np.ndarray: The whole sequence when using the 'numpy' backend.
         """
+        if self.backend == 'numpy':
+            return self._bits
+        return self._sweep_ones()
+
+    def _sweep_ones(self) -> Generator[int, None, None]:
+        """Pure-Python generator behind ``sweep_ones``."""
         for i in range(self.width):
             yield 1 << i
 
-    def sweep_zeros(self) -> Generator[int, None, None]:
+    def sweep_zeros(self) -> Patterns:
         """
         Generator that yields numbers with all bits set except for a sweeping '0'.
 
         Yields:
             int: An integer with one bit cleared, sweeping from LSB to MSB.
+
+        Returns:
+            np.ndarray: The whole sequence when using the 'numpy' backend.
         """
+        if self.backend == 'numpy':
+            return self._cached(('sweep_zeros',),
+                                lambda: self._bits ^ self._dtype(self.mask))
+        return self._sweep_zeros()
+
+    def _sweep_zeros(self) -> Generator[int, None, None]:
+        """Pure-Python generator behind ``sweep_zeros``."""
         for i in range(self.width):
             yield self.mask ^ (1 << i)
 
-    def toggle_sparse(self, step: int = 3) -> Generator[int, None, None]:
+    def toggle_sparse(self, step: int = 3) -> Patterns:
         """
         Generator that yields integers with bits toggled sparsely at the given step.
 
@@ -76,58 +155,193 @@ class BitBrush:
 
         Yields:
             int: An integer with sparsely distributed 1s.
+
+        Returns:
+            np.ndarray: The whole sequence when using the 'numpy' backend,
+                built with a single cumulative bitwise OR.
         """
+        if self.backend == 'numpy':
+            return self._cached(('toggle_sparse', step),
+                                lambda: np.bitwise_or.accumulate(self._bits[0:self.width:step]))
+        return self._toggle_sparse(step)
+
+    def _toggle_sparse(self, step: int) -> Generator[int, None, None]:
+        """Pure-Python generator behind ``toggle_sparse``."""
         val = 0
         for i in range(0, self.width, step):
             val |= 1 << i
             yield val
 
-    def mirror_mask(self, value: int) -> int:
+    def mirror_mask(self, value: Union[int, "np.ndarray"]) -> Union[int, "np.ndarray"]:
         """
         Mirrors (reverses) the bit pattern of the given value within the specified width.
 
-        This optimized version uses a precomputed 8-bit lookup table
-        for fast bit reversal in blocks.
+        This optimized version uses a precomputed 8-bit lookup table:
+        the value is serialized little-endian, every byte is reversed with
+        ``bytes.translate`` and the result is read back big-endian, so the
+        per-byte work runs in C. NumPy arrays are mirrored element-wise
+        in a single vectorized pass.
+
+        Args:
+            value (int | np.ndarray): The integer (or integer array) to mirror.
+
+        Returns:
+            int | np.ndarray: The mirrored bit pattern(s).
+        """
+        if np is not None and isinstance(value, np.ndarray):
+            return self._mirror_array(value)
+        raw = (int(value) & self._mirror_byte_mask).to_bytes(self._mirror_bytes, 'little')
+        return int.from_bytes(raw.translate(self._mirror_lut), 'big') >> self._mirror_shift
+
+    def _mirror_array(self, value: "np.ndarray") -> "np.ndarray":
+        """
+        Mirrors every element of a NumPy array within the specified width.
+
+        Bits are first reversed inside each byte with three swap stages
+        (adjacent bits, bit pairs, nibbles), then the byte order of each
+        lane is reversed. Lanes are the narrowest unsigned dtype holding
+        ``width`` bits, so narrow widths move less memory per stage. The pass
+        count is fixed regardless of width, and all stages run in place on
+        one working and one scratch buffer.
 
         Args:
-            value (int): The integer to mirror.
+            value (np.ndarray): Integer array to mirror.
 
         Returns:
-            int: The mirrored bit pattern as an integer.
+            np.ndarray: Mirrored bit patterns in the narrowest unsigned dtype
+                fitting the width.
         """
-        result = 0
-        bytes_needed = (self.width + 7) // 8
-        for i in range(bytes_needed):
-            byte = (value >> (i * 8)) & 0xFF
-            mirrored_byte = self._mirror_lut[byte]
-            shift = (bytes_needed - 1 - i) * 8
-            result |= mirrored_byte << shift
-        return result >> (bytes_needed * 8 - self.width)
+        if self.width > 64:
+            raise ValueError("Array mirroring supports widths up to 64 bits.")
+        lane = self._dtype
+        lane_bytes = np.dtype(lane).itemsize
+        lane_mask = (1 << (lane_bytes * 8)) - 1
+        v = value.astype(lane)
+        tmp = np.empty_like(v)
+        for shift, pattern in ((1, 0x5555555555555555),
+                               (2, 0x3333333333333333),
+                               (4, 0x0F0F0F0F0F0F0F0F)):
+            s, m = lane(shift), lane(pattern & lane_mask)
+            np.right_shift(v, s, out=tmp)
+            tmp &= m
+            v &= m
+            v <<= s
+            v |= tmp
+        v.byteswap(inplace=True)
+        v >>= lane(lane_bytes * 8 - self.width)
+        return v
 
-    def scan_patterns(self) -> Generator[int, None, None]:
+    def scan_patterns(self) -> Patterns:
         """
         Generator that yields symmetric bit patterns growing from the center outward.
 
         Yields:
             int: Bit patterns sweeping outward and inward from the center.
+
+        Returns:
+            np.ndarray: The whole sequence when using the 'numpy' backend.
+        """
+        if self.backend == 'numpy':
+            return self._cached(('scan_patterns',), self._scan_patterns_array)
+        return self._scan_patterns()
+
+    def _scan_patterns_array(self) -> "np.ndarray":
+        """
+        Vectorized computation behind ``scan_patterns`` for the 'numpy' backend.
+
+        Pattern ``r`` is ``bits[center - r] | bits[center + r]``, so the result is
+        the left half of ``_bits`` reversed, OR-ed in place with the right half;
+        radii past the top bit have no right-hand partner.
         """
         center = self.width // 2
+        patterns = self._bits[center::-1].copy()
+        patterns[:self.width - center] |= self._bits[center:]
+        return patterns
+
+    def _scan_patterns(self) -> Generator[int, None, None]:
+        """Pure-Python generator behind ``scan_patterns``."""
+        center = self.width // 2
         for radius in range(center + 1):
             left = 1 << (center - radius)
             right = 1 << (center + radius) if center + radius < self.width else 0
             yield left | right
 
-    def count_ones(self, value: int) -> int:
+    def count_ones(self, value: Union[int, "np.ndarray"]) -> int:
         """
         Counts the number of 1 bits in the given value.
 
+        For a NumPy array the bits of every element are counted and
+        summed, treating the array as one bitset.
+
         Args:
-            value (int): The integer to analyze.
+            value (int | np.ndarray): The integer (or integer array) to analyze.
 
         Returns:
             int: Number of bits set to 1.
         """
-        return bin(value & self.mask).count('1')
+        if np is not None and isinstance(value, np.ndarray):
+            return self._count_ones_array(value)
+        return (int(value) & self.mask).bit_count()
+
+    def _count_ones_array(self, value: "np.ndarray") -> int:
+        """
+        Counts the 1 bits across all elements of a NumPy array.
+
+        Uses the native ``np.bitwise_count`` popcount where available
+        (NumPy 2.0+) and falls back to unpacking the bytes otherwise.
+        Arrays already in the instance dtype are counted without a cast, and
+        masking is skipped when the width fills the whole dtype.
+
+        Args:
+            value (np.ndarray): Integer array to analyze.
+
+        Returns:
+            int: Total number of bits set to 1 within the width of each element.
+        """
+        if self.width > 64:
+            raise ValueError("Array bit counting supports widths up to 64 bits.")
+        v = value.astype(self._dtype, copy=False)
+        if self.mask != np.iinfo(self._dtype).max:
+            v = v & self._dtype(self.mask)
+        if hasattr(np, 'bitwise_count'):
+            return int(np.bitwise_count(v).sum(dtype=np.uint64))
+        return int(np.count_nonzero(np.unpackbits(np.ascontiguousarray(v).view(np.uint8))))
+
+    def pospopcount(self, value: "np.ndarray") -> "np.ndarray":
+        """
+        Counts, for every bit position, how many elements have that bit set.
+
+        Each byte column is histogrammed once with ``np.bincount`` and the
+        256-bin histogram is multiplied by a byte-to-bits table, so the data
+        is read once per byte column without expanding it to one byte per bit.
+        Elements are read as the narrowest little-endian unsigned lane covering
+        the width, so matching input is used without a copy and wider input is
+        narrowed rather than widened; unsigned input narrower than that lane is
+        read as-is, its missing high columns counting as zero.
+
+        Args:
+            value (np.ndarray): Integer array of bit patterns.
+
+        Returns:
+            np.ndarray: An int64 array of length ``width``; index ``i`` holds the
+                number of elements with bit ``i`` set.
+        """
+        if np is None:
+            raise ImportError("pospopcount requires NumPy.")
+        if self.width > 64:
+            raise ValueError("Positional bit counting supports widths up to 64 bits.")
+        byte_columns = (self.width + 7) // 8
+        data = np.asarray(value)
+        lane = np.dtype(self._dtype).newbyteorder('<')
+        if data.dtype.kind == 'u' and data.dtype.itemsize < lane.itemsize:
+            lane = data.dtype.newbyteorder('<')
+        data = np.ascontiguousarray(data.astype(lane, copy=False)).reshape(-1)
+        columns = data.view(np.uint8).reshape(-1, lane.itemsize)
+        counts = np.zeros(byte_columns * 8, dtype=np.int64)
+        for i in range(min(byte_columns, lane.itemsize)):
+            histogram = np.bincount(columns[:, i], minlength=256)
+            counts[i * 8:(i + 1) * 8] = histogram @ _BYTE_BITS
+        return counts[:self.width]
 
     def visualize(self, value: int) -> str:
         """
@@ -140,3 +354,28 @@ class BitBrush:
             str: A binary string with leading zeros up to the configured width.
         """
         return f'{value & self.mask:0{self.width}b}'
+
+    def visualize_many(self, values: "np.ndarray") -> "np.ndarray":
+        """
+        Returns binary string representations for every element of an array.
+
+        The values are unpacked to bits in big-endian order and the low
+        ``width`` bits of each row are mapped to ASCII '0'/'1' in one pass,
+        so no per-element string formatting takes place.
+
+        Args:
+            values (np.ndarray): Integer array to convert.
+
+        Returns:
+            np.ndarray: A bytes-string array (dtype ``S<width>``) with the same
+                shape as ``values``; each entry matches ``visualize`` encoded as ASCII.
+        """
+        if np is None:
+            raise ImportError("visualize_many requires NumPy.")
+        if self.width > 64:
+            raise ValueError("Array visualization supports widths up to 64 bits.")
+        values = np.asarray(values)
+        rows = values.astype('>u8').reshape(-1).view(np.uint8).reshape(-1, 8)
+        bits = np.unpackbits(rows, axis=1)[:, 64 - self.width:]
+        chars = bits + np.uint8(ord('0'))
+        return chars.view(f'S{self.width}').reshape(values.shape)
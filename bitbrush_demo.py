@@ -9,12 +9,17 @@ and visualizes their execution time using bar plots.
 
 import time
 import matplotlib.pyplot as plt
+import numpy as np
 from bitbrush import BitBrush
 
 def benchmark_operation(name: str, func, *args) -> float:
     """
     Measures execution time for a given BitBrush operation.
 
+    The result is always fully materialized so both backends are measured
+    fairly: generators are consumed end-to-end and NumPy arrays are reduced,
+    which reads every element without boxing it into a Python int.
+
     Args:
         name (str): Name of the operation.
         func (callable): The function to benchmark.
@@ -24,8 +29,11 @@ def benchmark_operation(name: str, func, *args) -> float:
         float: Execution time in milliseconds.
     """
     start = time.perf_counter()
-    for _ in func(*args):
-        pass
+    result = func(*args)
+    if isinstance(result, np.ndarray):
+        result.sum()
+    else:
+        sum(result)
     end = time.perf_counter()
     return (end - start) * 1000
 